@@ -1,21 +1,25 @@
 import pandas as pd
 import numpy as np
-import seaborn as sns
 import matplotlib
 matplotlib.use('Agg')  # Set non-interactive backend to prevent tkinter issues
 import matplotlib.pyplot as plt
-from scipy.signal import savgol_filter
-from sklearn.preprocessing import StandardScaler, MinMaxScaler
+from matplotlib.collections import LineCollection
+from scipy.signal import savgol_coeffs
+from sklearn.preprocessing import StandardScaler
 from sklearn.decomposition import PCA
-from sklearn.model_selection import train_test_split, GridSearchCV, KFold
-from sklearn.ensemble import RandomForestRegressor, GradientBoostingRegressor
+from sklearn.experimental import enable_halving_search_cv  # noqa: F401
+from sklearn.model_selection import HalvingGridSearchCV, KFold, cross_validate
+from sklearn.ensemble import RandomForestRegressor, ExtraTreesRegressor, HistGradientBoostingRegressor
 from sklearn.svm import SVR
-from sklearn.metrics import mean_squared_error, r2_score, mean_absolute_error
 from sklearn.impute import KNNImputer
-from sklearn.pipeline import make_pipeline, Pipeline
+from sklearn.pipeline import make_pipeline
 from sklearn.feature_selection import RFE, SelectFromModel
-import shap
+from sklearn.inspection import permutation_importance
 import time
+import hashlib
+import inspect
+from functools import lru_cache
+from joblib import Memory, Parallel, delayed, parallel_backend
 from warnings import filterwarnings
 filterwarnings('ignore')
 
@@ -29,8 +33,74 @@ PREDICTIONS_FILE = OUTPUT_DIR / "soil_predictions.csv"
 
 OUTPUT_DIR.mkdir(exist_ok=True)
 
+memory = Memory(OUTPUT_DIR / "cache", verbose=0)
+CACHE_BYTES_LIMIT = '500M'  # every new upload adds entries, trimmed after each run
+
+@lru_cache(maxsize=None)
+def code_version():
+    """Hash of the helpers and constants the cached functions depend on"""
+    # joblib.Memory only tracks the decorated function's own source
+    h = hashlib.sha1()
+    for func in (groupby_median, savgol_matrix, spectral_features):
+        h.update(inspect.getsource(func).encode())
+    h.update(repr((WAVELENGTHS, KNN_IMPUTE_ABOVE_ROWS, SG_WINDOW, SG_POLYORDER)).encode())
+    return h.hexdigest()
+
+def cache_key(*objs):
+    """Content hash of frames/series, independent of their internal block layout"""
+    h = hashlib.sha1(code_version().encode())
+    for obj in objs:
+        h.update(pd.util.hash_pandas_object(obj, index=True).values.tobytes())
+        if isinstance(obj, pd.DataFrame):
+            h.update(repr([str(c) for c in obj.columns]).encode())
+            h.update(repr([str(t) for t in obj.dtypes]).encode())
+        else:
+            h.update(repr((str(obj.name), str(obj.dtype))).encode())
+    return h.hexdigest()
+
+class TrainingTimeout(Exception):
+    """Raised with the partial results when train_models runs out of time, so they aren't cached"""
+    def __init__(self, results):
+        super().__init__("Model training timed out")
+        self.results = results
+
+WAVELENGTHS = ['410', '435', '460', '485', '510', '535', 
+               '560', '585', '610', '645', '680', '705', 
+               '730', '760', '810', '860', '900', '940']
+KNN_IMPUTE_ABOVE_ROWS = 500
+SG_WINDOW = 11
+SG_POLYORDER = 2
+
+@lru_cache(maxsize=None)
+def savgol_matrix(n_points, window_length=SG_WINDOW, polyorder=SG_POLYORDER):
+    """Savitzky-Golay filter (mode='interp') as an (n_points x n_points) matrix"""
+    if window_length > n_points:
+        raise ValueError("If mode is 'interp', window_length must be less than or equal to the size of x.")
+    half = window_length // 2
+    matrix = np.zeros((n_points, n_points))
+    for i in range(n_points):
+        # Edge points are evaluated on the polynomial fitted to the first/last window
+        start = min(max(i - half, 0), n_points - window_length)
+        matrix[i, start:start + window_length] = savgol_coeffs(
+            window_length, polyorder, pos=i - start, use='dot')
+    return matrix
+
+# Prime the lru_cache for the full band set at import
+savgol_matrix(len(WAVELENGTHS))
+
 # Data Preprocessing
+def groupby_median(df, key):
+    """Per-group median of the numeric columns, one row per group in order of first appearance (not sorted by key)"""
+    num_cols = [c for c in df.select_dtypes(include=[np.number]).columns if c != key]
+    # Restricting to the numeric block keeps pandas on its Cython median path
+    return df.groupby(key, sort=False, observed=True)[num_cols].median().reset_index()
+
 def preprocess_data(df):
+    return _preprocess_data(df, cache_key(df))
+
+# The frame itself is left out of joblib's hash, cache_key() stands in for it
+@memory.cache(ignore=['df'])
+def _preprocess_data(df, key):
     if 'Records' in df.columns:
         df['Soil_ID'] = df['Records'].str.split('-').str[0]
         df['Moisture_Level'] = df['Soil_ID'].str.split('_').str[1]
@@ -39,51 +109,77 @@ def preprocess_data(df):
         
         df['Soil_ID'] = [f"Sample_{i}" for i in range(1, len(df)+1)]
     
-    aggregated = df.groupby('Soil_ID').median(numeric_only=True).reset_index()
+    aggregated = groupby_median(df, 'Soil_ID')
     
     sensor_cols = ['Moist', 'EC (u/10 gram)', 'Ph', 
-                 'Nitro (mg/10 g)', 'Posh Nitro (mg/10 g)', 'Pota Nitro (mg/10 g)','Ph', 
                  'Nitro (mg/10 g)', 'Posh Nitro (mg/10 g)', 'Pota Nitro (mg/10 g)']
     
     existing_sensor_cols = [col for col in sensor_cols if col in aggregated.columns]
     aggregated[existing_sensor_cols] = aggregated[existing_sensor_cols].replace(0, np.nan)
     
     if existing_sensor_cols:
-        imputer = KNNImputer(n_neighbors=3)
-        aggregated[existing_sensor_cols] = imputer.fit_transform(aggregated[existing_sensor_cols])
+        if len(aggregated) > KNN_IMPUTE_ABOVE_ROWS:
+            imputer = KNNImputer(n_neighbors=3)
+            aggregated[existing_sensor_cols] = imputer.fit_transform(aggregated[existing_sensor_cols])
+        else:
+            # Column median fill, zeros are treated as missing readings
+            arr = aggregated[existing_sensor_cols].to_numpy(dtype=np.float64)
+            col_med = np.nanmedian(arr, axis=0)
+            idx = np.where(np.isnan(arr))
+            arr[idx] = np.take(col_med, idx[1])
+            aggregated[existing_sensor_cols] = arr
     
     return aggregated
 
+def spectral_features(X, bands):
+    """First derivative of the z-scored bands, plus NDI and SIR (None when their bands are missing)"""
+    # Z-score per band (constant bands keep unit scale, as StandardScaler does)
+    sd = X.std(axis=0)
+    sd[sd == 0] = 1.0
+    z = (X - X.mean(axis=0)) / sd
+    
+    # Same stencil as np.gradient: central differences inside, one-sided at the edges
+    deriv = np.empty_like(z)
+    deriv[:, 1:-1] = 0.5 * (z[:, 2:] - z[:, :-2])
+    deriv[:, 0] = z[:, 1] - z[:, 0]
+    deriv[:, -1] = z[:, -1] - z[:, -2]
+    
+    pos = {w: i for i, w in enumerate(bands)}
+    ndi = sir = None
+    if '860' in pos and '645' in pos:
+        nir, red = X[:, pos['860']], X[:, pos['645']]
+        ndi = (nir - red) / (nir + red)
+    if '730' in pos and '680' in pos:
+        sir = X[:, pos['730']] / X[:, pos['680']]
+    
+    return deriv, ndi, sir
+
 def process_spectral_data(df):
-    wavelengths = ['410', '435', '460', '485', '510', '535', 
-                 '560', '585', '610', '645', '680', '705', 
-                 '730', '760', '810', '860', '900', '940']
-    
-    existing_wavelengths = [w for w in wavelengths if w in df.columns]
+    return _process_spectral_data(df, cache_key(df))
+
+@memory.cache(ignore=['df'])
+def _process_spectral_data(df, key):
+    existing_wavelengths = [w for w in WAVELENGTHS if w in df.columns]
     
     if existing_wavelengths:
-        df[existing_wavelengths] = savgol_filter(df[existing_wavelengths], 
-                                               window_length=11, 
-                                               polyorder=2,
-                                               axis=1)
-        
-        scaler = StandardScaler()
-        spectral_data = scaler.fit_transform(df[existing_wavelengths])
+        sg_matrix = savgol_matrix(len(existing_wavelengths))
+        smoothed = df[existing_wavelengths].to_numpy(dtype=np.float64) @ sg_matrix.T
+        df[existing_wavelengths] = smoothed
         
-        deriv = np.gradient(spectral_data, axis=1)
-        
-        if '860' in df.columns and '645' in df.columns:
-            df['NDI'] = (df['860'] - df['645']) / (df['860'] + df['645'])
-        if '730' in df.columns and '680' in df.columns:
-            df['SIR'] = df['730'] / df['680']
+        deriv, ndi, sir = spectral_features(smoothed, existing_wavelengths)
+        if ndi is not None:
+            df['NDI'] = ndi
+        if sir is not None:
+            df['SIR'] = sir
         
         deriv_cols = [f'd{w}' for w in existing_wavelengths]
-        df = pd.concat([df, pd.DataFrame(deriv, columns=deriv_cols)], axis=1)
+        df[deriv_cols] = deriv
     
     return df
 
 # Feature Engineer
-def create_features(df):
+def create_features(df, pca=None):
+    """Add band averages and spectral PCA components; pass a fitted pca to reuse it on new samples"""
     existing_cols = df.columns.tolist()
     
     vis_cols = [f'{w}' for w in range(400, 700, 10) if f'{w}' in existing_cols]
@@ -95,16 +191,25 @@ def create_features(df):
         df['NIR_avg'] = df[nir_cols].mean(axis=1)
     
     wavelengths = [str(w) for w in range(400, 1000, 10) if str(w) in existing_cols]
-    if wavelengths:
-        pca = PCA(n_components=min(5, len(wavelengths)))
-        pca_features = pca.fit_transform(df[wavelengths])
-        df_pca = pd.DataFrame(pca_features, columns=[f'PCA_{i+1}' for i in range(pca_features.shape[1])])
-        df = pd.concat([df, df_pca], axis=1)
+    # PCA only pays off with at least as many bands as components
+    if len(wavelengths) >= 5:
+        if pca is None:
+            pca = PCA(n_components=5, svd_solver='randomized', random_state=42)
+            pca_features = pca.fit_transform(df[wavelengths])
+        else:
+            pca_features = pca.transform(df[wavelengths])
+        for i in range(pca_features.shape[1]):
+            df[f'PCA_{i+1}'] = pca_features[:, i]
     
-    return df
+    return df, pca
 
 # Feature Selection
-def select_features(X, y, method='importance', threshold=0.5):
+def importance_model(X, y):
+    """Fit the shallow forest used to rank features"""
+    model = ExtraTreesRegressor(n_estimators=50, max_depth=10, n_jobs=-1, random_state=42)
+    return model.fit(X, y)
+
+def select_features(X, y, method='importance', threshold=0.5, model=None, exact_rfe=False):
     """Select features using specified method"""
     if method == 'correlation':
         corr = pd.concat([X, y], axis=1).corr()[y.name].abs()
@@ -112,23 +217,39 @@ def select_features(X, y, method='importance', threshold=0.5):
         selected.remove(y.name)
         return selected
     elif method == 'rfe':
-        selector = RFE(RandomForestRegressor(n_estimators=50), n_features_to_select=10)
-        selector.fit(X, y)
-        return X.columns[selector.support_].tolist()
+        if exact_rfe:
+            selector = RFE(ExtraTreesRegressor(n_estimators=50, n_jobs=-1, random_state=42), n_features_to_select=10)
+            selector.fit(X, y)
+            return X.columns[selector.support_].tolist()
+        # One fitted forest ranked by permutation importance instead of refitting per feature
+        if model is None:
+            model = importance_model(X, y)
+        result = permutation_importance(model, X, y, n_repeats=5, n_jobs=-1, random_state=42)
+        return X.columns[np.argsort(-result.importances_mean)[:10]].tolist()
     elif method == 'importance':
-        model = RandomForestRegressor(n_estimators=50)
-        model.fit(X, y)
-        selector = SelectFromModel(model, threshold=f'{threshold}*mean')
-        selector.fit(X, y)
+        if model is None:
+            model = importance_model(X, y)
+        selector = SelectFromModel(model, threshold=f'{threshold}*mean', prefit=True)
         return X.columns[selector.get_support()].tolist()
     else:
         return X.columns.tolist()
 
 # Modeling (Optimized)
-def train_models(X, y):
+def train_models(X, y, n_jobs=-1):
+    try:
+        return _train_models(X, y, cache_key(X, y), n_jobs=n_jobs)
+    except TrainingTimeout as e:
+        return e.results
+
+@memory.cache(ignore=['X', 'y', 'n_jobs'])
+def _train_models(X, y, key, n_jobs=-1):
     start_time = time.time()
     timeout = 1200  # 20 minutes timeout
     
+    # Materialize once so the searches below don't re-convert the frame per fit
+    X_arr = np.ascontiguousarray(X.to_numpy(dtype=np.float32))
+    y_arr = np.asarray(y, dtype=np.float32)
+    
     models = {
         'Random Forest': {
             'model': RandomForestRegressor(random_state=42),
@@ -136,16 +257,16 @@ def train_models(X, y):
                 'n_estimators': [100, 200],
                 'max_depth': [None, 10, 20],
                 'min_samples_split': [2, 5],
-                'n_jobs': [-1]
+                'n_jobs': [n_jobs]
             },
             'pipeline': None
         },
         'Gradient Boosting': {
-            'model': GradientBoostingRegressor(random_state=42),
+            'model': HistGradientBoostingRegressor(max_iter=200, random_state=42),
             'params': {
-                'n_estimators': [100, 200],
-                'learning_rate': [0.01, 0.1],
-                'max_depth': [3, 5]
+                'learning_rate': [0.05, 0.1],
+                'max_depth': [None, 6],
+                'max_leaf_nodes': [31, 63]
             },
             'pipeline': None
         },
@@ -154,7 +275,7 @@ def train_models(X, y):
             'params': {
                 'svr__C': [0.1, 1, 10, 100],
                 'svr__gamma': ['scale', 'auto', 0.01, 0.1],
-                'svr__kernel': ['rbf', 'poly']
+                'svr__kernel': ['rbf']
             },
             'pipeline': make_pipeline(StandardScaler(), SVR())
         }
@@ -162,74 +283,98 @@ def train_models(X, y):
     
     results = {}
     kf = KFold(n_splits=5, shuffle=True, random_state=42)
+    timed_out = False
     
     for name, config in models.items():
         if time.time() - start_time > timeout:
             print(f"Timeout reached during {name} training")
+            timed_out = True
             break
             
         print(f"\nTraining {name}...")
         try:
-            scores = []
-            best_params_list = []
+            # libsvm works in float64, the tree models are fine with float32
+            X_fit = X_arr.astype(np.float64) if config['pipeline'] else X_arr
             
-            for fold, (train_idx, test_idx) in enumerate(kf.split(X), 1):
-                if time.time() - start_time > timeout:
-                    print(f"Timeout during {name} fold {fold}")
-                    break
-                    
-                X_train, X_test = X.iloc[train_idx], X.iloc[test_idx]
-                y_train, y_test = y.iloc[train_idx], y.iloc[test_idx]
-                
-                if config['pipeline']:
-                    gs = GridSearchCV(
-                        config['pipeline'],
-                        config['params'],
-                        cv=3,
-                        scoring='r2',
-                        n_jobs=-1,
-                        verbose=1
-                    )
-                else:
-                    gs = GridSearchCV(
-                        config['model'],
-                        config['params'],
-                        cv=3,
-                        scoring='r2',
-                        n_jobs=-1,
-                        verbose=1
-                    )
-                
-                gs.fit(X_train, y_train)
-                pred = gs.predict(X_test)
-                
-                fold_scores = {
-                    'R2': r2_score(y_test, pred),
-                    'RMSE': np.sqrt(mean_squared_error(y_test, pred)),
-                    'MAE': mean_absolute_error(y_test, pred)
-                }
-                scores.append(fold_scores)
-                best_params_list.append(gs.best_params_)
-                
-                print(f"Fold {fold} completed - R2: {fold_scores['R2']:.3f}")
-                print(f"Best params: {gs.best_params_}")
+            # Tune once on all samples, then score the winner with the outer folds
+            search = HalvingGridSearchCV(
+                config['pipeline'] if config['pipeline'] else config['model'],
+                config['params'],
+                cv=5,
+                factor=3,
+                resource='n_samples',
+                min_resources=min(50, len(X_arr)),
+                scoring='r2',
+                refit=True,
+                return_train_score=False,
+                n_jobs=n_jobs,
+                verbose=0
+            )
+            search.fit(X_fit, y_arr)
+            best_estimator, best_params = search.best_estimator_, search.best_params_
+            # Only the winner is kept, drop the per-candidate results before they get pickled
+            del search.cv_results_
+            del search
+            print(f"Best params: {best_params}")
+            
+            cv_scores = cross_validate(
+                best_estimator,
+                X_fit,
+                y_arr,
+                cv=kf,
+                scoring=['r2', 'neg_root_mean_squared_error', 'neg_mean_absolute_error'],
+                n_jobs=n_jobs
+            )
             
-            if scores:
-                best_idx = np.argmax([s['R2'] for s in scores])
-                results[name] = {
-                    'R2': np.mean([s['R2'] for s in scores]),
-                    'RMSE': np.mean([s['RMSE'] for s in scores]),
-                    'MAE': np.mean([s['MAE'] for s in scores]),
-                    'best_params': best_params_list[best_idx],
-                    'is_pipeline': config['pipeline'] is not None,
-                    'model': gs.best_estimator_
-                }
+            results[name] = {
+                'R2': np.mean(cv_scores['test_r2']),
+                'RMSE': -np.mean(cv_scores['test_neg_root_mean_squared_error']),
+                'MAE': -np.mean(cv_scores['test_neg_mean_absolute_error']),
+                'best_params': best_params,
+                'is_pipeline': config['pipeline'] is not None,
+                'model': best_estimator
+            }
+            print(f"{name} completed - R2: {results[name]['R2']:.3f}")
                 
         except Exception as e:
             print(f"Error in {name}: {str(e)}")
             continue
     
-    return pd.DataFrame.from_dict(results, orient='index')
+    results = pd.DataFrame.from_dict(results, orient='index')
+    if timed_out:
+        # joblib.Memory doesn't persist calls that raise, keep the truncated set out of the cache
+        raise TrainingTimeout(results)
+    return results
+
+def _fit_target(target_col, numeric_features, final_df, ranker):
+    print(f"\n=== Processing target: {target_col} ===")
+    
+    targets = final_df[target_col]
+    
+    analyze_correlations(final_df, target_col)
+    
+    # Feature selection
+    print("Selecting features...")
+    selected_features = select_features(
+        numeric_features, 
+        targets, 
+        method='importance', 
+        threshold=0.5,
+        model=ranker
+    )
+    print(f"Selected {len(selected_features)} features for {target_col}")
+    
+    if len(selected_features) == 0:
+        print("No features selected, using all features")
+        selected_features = numeric_features.columns.tolist()
+    
+    X = numeric_features[selected_features]
+    
+    # Model training, targets already run in parallel so keep each search serial
+    print("Starting model training...")
+    results = train_models(X, targets, n_jobs=1)
+    
+    return selected_features, results
 
 def plot_spectral_profiles(df):
     try:
@@ -237,8 +382,12 @@ def plot_spectral_profiles(df):
         if wavelengths:
             wavelengths = sorted(wavelengths, key=lambda x: int(x))
             fig, ax = plt.subplots(figsize=(12, 6))
-            for idx in np.random.choice(len(df), min(5, len(df)), replace=False):
-                ax.plot([int(w) for w in wavelengths], df.iloc[idx][wavelengths], alpha=0.5)
+            idxs = np.random.choice(len(df), min(5, len(df)), replace=False)
+            xs = np.array([int(w) for w in wavelengths], dtype=float)
+            segs = np.stack([np.tile(xs, (len(idxs), 1)),
+                             df.iloc[idxs][wavelengths].to_numpy(dtype=float)], axis=-1)
+            ax.add_collection(LineCollection(segs, colors=plt.rcParams['axes.prop_cycle'].by_key()['color'], alpha=0.5))
+            ax.autoscale()
             ax.set_xlabel('Wavelength (nm)')
             ax.set_ylabel('Normalized Reflectance')
             ax.set_title('Spectral Profiles')
@@ -253,7 +402,17 @@ def analyze_correlations(df, target='Moist'):
         if target in df.columns:
             numeric_df = df.select_dtypes(include=[np.number])
             if target in numeric_df.columns:
-                correlations = numeric_df.corr()[target].sort_values(ascending=False)
+                # Only the row for the target is needed, not the full K x K matrix
+                if numeric_df.isna().any().any():
+                    # corrwith drops missing values pairwise, as DataFrame.corr does
+                    correlations = numeric_df.corrwith(numeric_df[target])
+                else:
+                    xs = numeric_df.to_numpy(dtype=np.float64)
+                    y = numeric_df[target].to_numpy(dtype=np.float64)
+                    xs_n = (xs - xs.mean(axis=0)) / xs.std(axis=0)
+                    y_n = (y - y.mean()) / y.std()
+                    correlations = pd.Series((xs_n.T @ y_n) / len(y), index=numeric_df.columns)
+                correlations = correlations.sort_values(ascending=False)
                 fig, ax = plt.subplots(figsize=(10, 6))
                 correlations[1:11].plot(kind='bar', ax=ax)
                 ax.set_title(f'Top Features Correlated with {target}')
@@ -279,7 +438,8 @@ if __name__ == "__main__":
     # Preprocess data
     processed_df = preprocess_data(df)
     spectral_df = process_spectral_data(processed_df)
-    final_df = create_features(spectral_df)
+    # spectral_pca is the fitted transform to pass back in for new samples
+    final_df, spectral_pca = create_features(spectral_df)
     
     print("\nAvailable columns:", final_df.columns.tolist())
     
@@ -304,7 +464,15 @@ if __name__ == "__main__":
     
     
     numeric_features = features.select_dtypes(include=[np.number])
+    # Same layout the models are trained on, sliced by column position below
+    numeric_arr = np.ascontiguousarray(numeric_features.to_numpy(dtype=np.float32))
+    
     
+    # Fit the feature-ranking forests up front, one per target
+    ranker_by_target = {
+        target_col: importance_model(numeric_features, final_df[target_col])
+        for target_col in available_targets
+    }
     
     all_results = {}
     best_models = {}
@@ -313,32 +481,17 @@ if __name__ == "__main__":
     if 'Moisture_Level' in final_df.columns:
         predictions_df['Moisture_Level'] = final_df['Moisture_Level']
     
-    for target_col in available_targets:
-        print(f"\n=== Processing target: {target_col} ===")
-        
-        targets = final_df[target_col]
-        
-        analyze_correlations(final_df, target_col)
-        
-        # Feature selection
-        print("Selecting features...")
-        selected_features = select_features(
-            numeric_features, 
-            targets, 
-            method='importance', 
-            threshold=0.5
+    # Targets are independent, train them in separate worker processes.
+    # One BLAS/OpenMP thread per worker so the processes don't oversubscribe the cores.
+    with parallel_backend('loky', n_jobs=os.cpu_count(), inner_max_num_threads=1):
+        results_list = Parallel()(
+            delayed(_fit_target)(target_col, numeric_features, final_df, ranker_by_target[target_col])
+            for target_col in available_targets
         )
-        print(f"Selected {len(selected_features)} features for {target_col}")
-        
-        if len(selected_features) == 0:
-            print("No features selected, using all features")
-            selected_features = numeric_features.columns.tolist()
-        
-        X = numeric_features[selected_features]
-        
-        # Model training
-        print("Starting model training...")
-        results = train_models(X, targets)
+    memory.reduce_size(bytes_limit=CACHE_BYTES_LIMIT)
+    
+    for target_col, (selected_features, results) in zip(available_targets, results_list):
+        X = numeric_arr[:, numeric_features.columns.get_indexer(selected_features)]
         
         if results.empty:
             print(f"Model training failed for {target_col}")
@@ -382,7 +535,7 @@ if __name__ == "__main__":
     successful_targets = 0
     for target, info in best_models.items():
         try:
-            X_all = numeric_features[info['features']]
+            X_all = numeric_arr[:, numeric_features.columns.get_indexer(info['features'])]
             predictions = info['model'].predict(X_all)
             predictions_df[target] = predictions
             successful_targets += 1